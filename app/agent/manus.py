@@ -38,9 +38,15 @@ class Manus(ToolCallAgent):
         )
     )
 
+    async def cleanup(self):
+        """Release the browser held by the browser_use tool."""
+        browser_tool = self.available_tools.get_tool("browser_use")
+        if browser_tool:
+            await browser_tool.cleanup()
+
     async def _handle_special_tool(self, name: str, result: Any, **kwargs):
         if not self._is_special_tool(name):
             return
         else:
-            await self.available_tools.get_tool(BrowserUseTool().name).cleanup()
+            await self.cleanup()
             await super()._handle_special_tool(name, result, **kwargs)
@@ -1,10 +1,15 @@
-from typing import Dict, List, Union
+from typing import Dict, List, Type, Union
 
 from app.agent.base import BaseAgent
 from app.flow.base import BaseFlow, FlowType
 from app.flow.planning import PlanningFlow
 
 
+_FLOW_REGISTRY: Dict[FlowType, Type[BaseFlow]] = {
+    FlowType.PLANNING: PlanningFlow,
+}
+
+
 class FlowFactory:
     """Factory for creating different types of flows with support for multiple agents"""
 
@@ -14,11 +19,7 @@ class FlowFactory:
         agents: Union[BaseAgent, List[BaseAgent], Dict[str, BaseAgent]],
         **kwargs,
     ) -> BaseFlow:
-        flows = {
-            FlowType.PLANNING: PlanningFlow,
-        }
-
-        flow_class = flows.get(flow_type)
+        flow_class = _FLOW_REGISTRY.get(flow_type)
         if not flow_class:
             raise ValueError(f"Unknown flow type: {flow_type}")
 
@@ -1,4 +1,5 @@
 import json
+import re
 import time
 from typing import Dict, List, Optional, Union
 
@@ -12,6 +13,9 @@ from app.schema import AgentState, Message, ToolChoice
 from app.tool import PlanningTool
 
 
+_STEP_TYPE_PATTERN = re.compile(r"\[([A-Z_]+)\]")
+
+
 class PlanningFlow(BaseFlow):
     """A flow that manages planning and execution of tasks using agents."""
 
@@ -192,9 +196,7 @@ class PlanningFlow(BaseFlow):
                     step_info = {"text": step}
 
                     # Try to extract step type from the text (e.g., [SEARCH] or [CODE])
-                    import re
-
-                    type_match = re.search(r"\[([A-Z_]+)\]", step)
+                    type_match = _STEP_TYPE_PATTERN.search(step)
                     if type_match:
                         step_info["type"] = type_match.group(1).lower()
 
@@ -17,6 +17,8 @@ async def main():
         logger.info("Request processing completed.")
     except KeyboardInterrupt:
         logger.warning("Operation interrupted.")
+    finally:
+        await agent.cleanup()
 
 
 if __name__ == "__main__":
@@ -44,6 +44,11 @@ async def run_flow():
         logger.info("Operation cancelled by user.")
     except Exception as e:
         logger.error(f"Error: {str(e)}")
+    finally:
+        # Release agent resources (e.g. browsers) however the run ended
+        await asyncio.gather(
+            *(agent.cleanup() for agent in agents.values() if hasattr(agent, "cleanup"))
+        )
 
 
 if __name__ == "__main__":